@@ -0,0 +1,565 @@
+"""
+Backend API checks for the Document Converter Application
+
+Kept apart from the backend_test.py runner and fully annotated so it can be
+compiled with `mypyc backend_tester.py` for long load runs
+"""
+
+import asyncio
+import httpx
+import io
+import os
+import sys
+import ijson  # type: ignore[import-untyped]
+import orjson
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+
+# Prefer uvloop's libuv-based loop when it is installed
+_loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]]
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:
+    _loop_factory = None
+
+# Load the backend URL from frontend .env
+BACKEND_URL = "https://96834ef1-aa31-4b27-a10a-812a36179caf.preview.emergentagent.com/api"
+
+# Per-request deadline in seconds, enforced with asyncio.timeout
+REQUEST_TIMEOUT = 30
+
+# Log buffer and results dict of the suite running in the current task, so
+# concurrently running suites don't interleave their output
+_SuiteOutput = tuple[io.StringIO, dict[str, dict[str, Any]]]
+_suite_output: ContextVar[_SuiteOutput] = ContextVar("_suite_output")
+
+# Payload returned by _request when a body is not valid JSON, so callers can tell
+# a decode failure apart from valid JSON of the wrong shape (including null)
+_INVALID_JSON = object()
+
+def _describe_error(exc: BaseException) -> str:
+    """Describe a request failure, naming the deadline for asyncio timeouts"""
+    if isinstance(exc, TimeoutError):
+        message = f"timed out after {REQUEST_TIMEOUT}s"
+    else:
+        message = str(exc)
+    return "; ".join([message, *getattr(exc, "__notes__", [])])
+
+def _first_failure(eg: ExceptionGroup) -> Exception:
+    """Unwrap a TaskGroup failure for the suite's error handler, noting any other failures"""
+    first, *others = eg.exceptions
+    for other in others:
+        first.add_note(f"also failed: {_describe_error(other)}")
+    return first
+
+class _ByteStreamReader:
+    """Adapt an httpx response byte stream to the async read() interface ijson expects"""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream with a zero-length read before parsing
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+class BackendTester:
+    def __init__(self, base_url: str = BACKEND_URL) -> None:
+        self.base_url: str = base_url
+        # Endpoint URLs are parsed once rather than on every request
+        self._url_root = httpx.URL(f"{self.base_url}/")
+        self._url_status = httpx.URL(f"{self.base_url}/status")
+        self._url_404 = httpx.URL(f"{self.base_url}/nonexistent")
+        # Created inside the event loop by run_all_tests
+        self._client: Optional[httpx.AsyncClient] = None
+        self.test_results: dict[str, dict[str, Any]] = {}
+        # Result details are only rendered into the log when explicitly requested
+        self.verbose = os.environ.get("BACKEND_TEST_VERBOSE") == "1"
+        # Log lines are buffered and written to stdout in one go by run_all_tests
+        self._log_buf = io.StringIO()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, only available while run_all_tests is running"""
+        if self._client is None:
+            raise RuntimeError("HTTP client is only available inside run_all_tests")
+        return self._client
+
+    def _log(self, line: str) -> None:
+        """Append a line to the buffered test log"""
+        log_buf, _ = _suite_output.get((self._log_buf, self.test_results))
+        log_buf.write(line + "\n")
+
+    def _flush_log(self) -> None:
+        """Write the buffered test log to stdout and reset the buffer"""
+        sys.stdout.write(self._log_buf.getvalue())
+        sys.stdout.flush()
+        self._log_buf = io.StringIO()
+
+    def log_test(self, test_name: str, success: bool, message: str,
+                 details: Optional[dict[str, Any]] = None) -> None:
+        """Log test results"""
+        _, test_results = _suite_output.get((self._log_buf, self.test_results))
+        test_results[test_name] = {
+            'success': success,
+            'message': message,
+            'details': details,
+            'ts_ns': time.time_ns()
+        }
+        status = "✅ PASS" if success else "❌ FAIL"
+        self._log(f"{status}: {test_name} - {message}")
+        if details and self.verbose:
+            self._log(f"   Details: {details}")
+
+    async def test_health_check_endpoint(self) -> bool:
+        """Test GET /api/ health check endpoint"""
+        self._log("\n=== Testing Health Check Endpoint ===")
+
+        try:
+            # Test without Origin header first
+            status_code, _, data = await self._request("GET", self._url_root)
+
+            # Check response status
+            if status_code != 200:
+                self.log_test("Health Check Status", False,
+                            f"Expected 200, got {status_code}")
+                return False
+
+            # Check response content
+            if data is _INVALID_JSON:
+                self.log_test("Health Check Response", False,
+                            "Invalid JSON response")
+                return False
+
+            if isinstance(data, dict) and data.get("message") == "Hello World":
+                self.log_test("Health Check Response", True,
+                            "Correct response message received")
+            else:
+                self.log_test("Health Check Response", False,
+                            f"Unexpected response: {data}")
+                return False
+
+            # Test with Origin header for CORS
+            _, headers_with_origin, _ = await self._request(
+                "GET",
+                self._url_root,
+                headers={"Origin": "https://example.com"}
+            )
+
+            # Check CORS headers
+            cors_origin = headers_with_origin.get('access-control-allow-origin')
+            cors_credentials = headers_with_origin.get('access-control-allow-credentials')
+
+            if cors_origin:
+                self.log_test("Health Check CORS", True,
+                            f"CORS headers present - Origin: {cors_origin}, Credentials: {cors_credentials}")
+            else:
+                self.log_test("Health Check CORS", False,
+                            "No CORS headers found")
+                return False
+
+            return True
+
+        except (httpx.HTTPError, TimeoutError) as e:
+            self.log_test("Health Check Connection", False,
+                        f"Connection error: {_describe_error(e)}")
+            return False
+
+    async def test_status_endpoints(self) -> bool:
+        """Test GET/POST /api/status endpoints"""
+        self._log("\n=== Testing Status Endpoints ===")
+
+        try:
+            # Test POST /api/status (Create)
+            ts = int(time.time())
+            test_data = {
+                "client_name": f"test_client_{ts}"
+            }
+
+            status_code, _, created_status = await self._request(
+                "POST",
+                self._url_status,
+                content=orjson.dumps(test_data)
+            )
+
+            if status_code != 200:
+                self.log_test("Status POST", False,
+                            f"Expected 200, got {status_code}")
+                return False
+
+            if created_status is _INVALID_JSON:
+                self.log_test("Status POST Response", False,
+                            "Invalid JSON response")
+                return False
+
+            if not isinstance(created_status, dict):
+                self.log_test("Status POST Structure", False,
+                            f"Unexpected response: {created_status}")
+                return False
+
+            # Validate response structure
+            required_fields = ['id', 'client_name', 'timestamp']
+            for field in required_fields:
+                if field not in created_status:
+                    self.log_test("Status POST Structure", False,
+                                f"Missing field: {field}")
+                    return False
+
+            # Validate data types
+            if not isinstance(created_status['id'], str):
+                self.log_test("Status POST ID Type", False,
+                            "ID should be string")
+                return False
+
+            if created_status['client_name'] != test_data['client_name']:
+                self.log_test("Status POST Data", False,
+                            "Client name mismatch")
+                return False
+
+            self.log_test("Status POST", True,
+                        "Status created successfully", created_status)
+
+            # Store created ID for cleanup
+            created_id = created_status['id']
+
+            # Test GET /api/status (Read)
+            async with asyncio.timeout(REQUEST_TIMEOUT), self.client.stream("GET", self._url_status) as response:
+
+                if response.status_code != 200:
+                    self.log_test("Status GET", False,
+                                f"Expected 200, got {response.status_code}")
+                    return False
+
+                try:
+                    scanned = await self._scan_status_ids(response, {created_id})
+                except ijson.JSONError:
+                    self.log_test("Status GET Response", False,
+                                "Invalid JSON response")
+                    return False
+
+            if scanned is None:
+                self.log_test("Status GET Structure", False,
+                            "Response should be a list")
+                return False
+
+            # Check if our created status is in the list
+            record_count, found = scanned
+            if created_id in found:
+                self.log_test("Status GET", True,
+                            f"Retrieved {record_count} status records")
+            else:
+                self.log_test("Status GET Persistence", False,
+                            "Created status not found in list")
+                return False
+
+            return True
+
+        except (httpx.HTTPError, TimeoutError) as e:
+            self.log_test("Status Endpoints Connection", False,
+                        f"Connection error: {_describe_error(e)}")
+            return False
+
+    async def _request(self, method: str, url: httpx.URL,
+                       **kwargs: Any) -> tuple[int, httpx.Headers, Any]:
+        """Issue a request and return (status_code, headers, parsed JSON body or _INVALID_JSON)"""
+        async with asyncio.timeout(REQUEST_TIMEOUT):
+            response = await self.client.request(method, url, **kwargs)
+        body = response.content
+        try:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            payload = _INVALID_JSON
+        return response.status_code, response.headers, payload
+
+    async def _scan_status_ids(self, response: httpx.Response,
+                               wanted: set[str]) -> Optional[tuple[int, set[str]]]:
+        """Stream a /status listing, returning (record_count, found_ids) or None if it is not a list"""
+        record_count = 0
+        found = set()
+        async for prefix, event, value in ijson.parse(_ByteStreamReader(response)):
+            if prefix == '':
+                if event not in ('start_array', 'end_array'):
+                    return None
+            elif prefix == 'item' and event not in ('map_key', 'end_map', 'end_array'):
+                # Every top-level element opens (or is) exactly one 'item' event
+                record_count += 1
+            elif prefix == 'item.id' and value in wanted:
+                found.add(value)
+        return record_count, found
+
+    async def _create_status(self, body: bytes) -> Optional[dict[str, Any]]:
+        """POST a pre-serialized status record, returning the parsed body or None on failure"""
+        status_code, _, data = await self._request("POST", self._url_status, content=body)
+        if status_code != 200 or not isinstance(data, dict):
+            return None
+        return data
+
+    async def test_mongodb_connectivity(self) -> bool:
+        """Test MongoDB connectivity through API operations"""
+        self._log("\n=== Testing MongoDB Connectivity ===")
+
+        # Create multiple records to test database operations
+        ts = int(time.time())
+        test_clients = [f"mongo_test_{i}_{ts}" for i in range(1, 4)]
+        bodies = [orjson.dumps({"client_name": client_name}) for client_name in test_clients]
+
+        created_ids: set[str] = set()
+
+        try:
+            # Create multiple records concurrently
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(self._create_status(body)) for body in bodies]
+            except ExceptionGroup as eg:
+                raise _first_failure(eg) from eg
+
+            for client_name, task in zip(test_clients, tasks):
+                data = task.result()
+                if data is not None:
+                    created_ids.add(data['id'])
+                else:
+                    self.log_test("MongoDB Write Test", False,
+                                f"Failed to create record for {client_name}")
+                    return False
+
+            self.log_test("MongoDB Write Operations", True,
+                        f"Successfully created {len(created_ids)} records")
+
+            # Test read operations
+            async with asyncio.timeout(REQUEST_TIMEOUT), self.client.stream("GET", self._url_status) as response:
+                if response.status_code != 200:
+                    self.log_test("MongoDB Read Test", False,
+                                "Failed to retrieve records")
+                    return False
+
+                try:
+                    scanned = await self._scan_status_ids(response, created_ids)
+                except ijson.JSONError:
+                    self.log_test("MongoDB Read Response", False,
+                                "Invalid JSON response")
+                    return False
+
+            if scanned is None:
+                self.log_test("MongoDB Read Structure", False,
+                            "Response should be a list")
+                return False
+
+            # Verify all created records exist
+            _, found = scanned
+            found_count = len(found)
+
+            if found_count == len(created_ids):
+                self.log_test("MongoDB Read Operations", True,
+                            f"All {found_count} created records retrieved")
+            else:
+                self.log_test("MongoDB Read Operations", False,
+                            f"Only found {found_count}/{len(created_ids)} records")
+                return False
+
+            return True
+
+        except (httpx.HTTPError, TimeoutError) as e:
+            self.log_test("MongoDB Connectivity", False,
+                        f"Database operation failed: {_describe_error(e)}")
+            return False
+
+    async def test_cors_configuration(self) -> bool:
+        """Test CORS configuration"""
+        self._log("\n=== Testing CORS Configuration ===")
+
+        try:
+            # Issue the preflight and the actual request concurrently
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    preflight = tg.create_task(self._request(
+                        "OPTIONS",
+                        self._url_status,
+                        headers={
+                            "Origin": "https://example.com",
+                            "Access-Control-Request-Method": "POST",
+                            "Access-Control-Request-Headers": "Content-Type"
+                        }
+                    ))
+                    actual = tg.create_task(self._request(
+                        "GET",
+                        self._url_root,
+                        headers={"Origin": "https://example.com"}
+                    ))
+            except ExceptionGroup as eg:
+                raise _first_failure(eg) from eg
+
+            # Check CORS headers in preflight response
+            _, preflight_headers, _ = preflight.result()
+            cors_headers = {
+                'access-control-allow-origin': preflight_headers.get('access-control-allow-origin'),
+                'access-control-allow-methods': preflight_headers.get('access-control-allow-methods'),
+                'access-control-allow-headers': preflight_headers.get('access-control-allow-headers'),
+                'access-control-allow-credentials': preflight_headers.get('access-control-allow-credentials')
+            }
+
+            # Validate CORS headers
+            if cors_headers['access-control-allow-origin']:
+                self.log_test("CORS Allow Origin", True,
+                            f"Origin header: {cors_headers['access-control-allow-origin']}")
+            else:
+                self.log_test("CORS Allow Origin", False,
+                            "Missing Access-Control-Allow-Origin header")
+                return False
+
+            # Test actual request with CORS
+            status_code, actual_headers, _ = actual.result()
+            origin_header = actual_headers.get('access-control-allow-origin')
+
+            if status_code == 200:
+                if origin_header:
+                    self.log_test("CORS Actual Request", True,
+                                f"CORS working for actual requests: {origin_header}")
+                    return True
+                else:
+                    self.log_test("CORS Actual Request", False,
+                                "No CORS headers in actual response")
+                    return False
+            else:
+                self.log_test("CORS Actual Request", False,
+                            f"Request failed with status {status_code}")
+                return False
+
+        except (httpx.HTTPError, TimeoutError) as e:
+            self.log_test("CORS Configuration", False,
+                        f"CORS test failed: {_describe_error(e)}")
+            return False
+
+    async def test_api_error_handling(self) -> bool:
+        """Test API error handling"""
+        self._log("\n=== Testing API Error Handling ===")
+
+        try:
+            # Test invalid endpoint
+            status_code, _, _ = await self._request("GET", self._url_404)
+
+            if status_code == 404:
+                self.log_test("404 Error Handling", True,
+                            "Correctly returns 404 for invalid endpoints")
+            else:
+                self.log_test("404 Error Handling", False,
+                            f"Expected 404, got {status_code}")
+                return False
+
+            # Test invalid JSON data
+            status_code, _, _ = await self._request(
+                "POST",
+                self._url_status,
+                content=orjson.dumps({})  # Missing required client_name
+            )
+
+            if status_code == 422:  # FastAPI validation error
+                self.log_test("Validation Error Handling", True,
+                            "Correctly returns 422 for invalid data")
+            else:
+                self.log_test("Validation Error Handling", False,
+                            f"Expected 422, got {status_code}")
+                return False
+
+            # Test malformed JSON
+            status_code, _, _ = await self._request(
+                "POST",
+                self._url_status,
+                content=b"invalid json"
+            )
+
+            if status_code in [400, 422]:
+                self.log_test("Malformed JSON Handling", True,
+                            f"Correctly handles malformed JSON with status {status_code}")
+            else:
+                self.log_test("Malformed JSON Handling", False,
+                            f"Unexpected status for malformed JSON: {status_code}")
+                return False
+
+            return True
+
+        except (httpx.HTTPError, TimeoutError) as e:
+            self.log_test("API Error Handling Connection", False,
+                        f"Connection error: {_describe_error(e)}")
+            return False
+
+    async def _run_suite(self, test_func: Callable[[], Awaitable[bool]],
+                         output: _SuiteOutput) -> bool:
+        """Run one suite with its log lines and results captured in output"""
+        _suite_output.set(output)
+        return await test_func()
+
+    async def _run_all_async(self) -> tuple[int, int]:
+        """Open the shared HTTP/2 client and run every test suite"""
+        # Over HTTP/2 every suite's requests are multiplexed on one TLS connection
+        async with httpx.AsyncClient(
+            http2=True,
+            headers={"Content-Type": "application/json"},
+            # Deadlines come from asyncio.timeout(REQUEST_TIMEOUT) around each request
+            timeout=None,
+            limits=httpx.Limits(max_connections=16)
+        ) as self._client:
+            test_functions = [
+                self.test_health_check_endpoint,
+                self.test_status_endpoints,
+                self.test_mongodb_connectivity,
+                self.test_cors_configuration,
+                self.test_api_error_handling
+            ]
+
+            # Each suite logs into its own buffer and results dict; they are merged
+            # below in test_functions order so the report reads as if run serially
+            outputs: list[_SuiteOutput] = [(io.StringIO(), {}) for _ in test_functions]
+            results = await asyncio.gather(
+                *(self._run_suite(test_func, output)
+                  for test_func, output in zip(test_functions, outputs)),
+                return_exceptions=True
+            )
+
+            passed_tests = 0
+
+            for test_func, (log_buf, test_results), result in zip(test_functions, outputs, results):
+                self._log_buf.write(log_buf.getvalue())
+                self.test_results.update(test_results)
+                if isinstance(result, BaseException):
+                    self._log(f"❌ CRITICAL ERROR in {test_func.__name__}: {str(result)}")
+                elif result:
+                    passed_tests += 1
+
+            return passed_tests, len(test_functions)
+
+    def run_all_tests(self) -> bool:
+        """Run all backend tests"""
+        self._log("🚀 Starting Backend Testing Suite for Document Converter")
+        self._log(f"Testing backend at: {self.base_url}")
+        self._log("=" * 60)
+
+        try:
+            with asyncio.Runner(loop_factory=_loop_factory) as runner:
+                passed_tests, total_tests = runner.run(self._run_all_async())
+
+            self._log("\n" + "=" * 60)
+            self._log(f"🏁 Backend Testing Complete: {passed_tests}/{total_tests} test suites passed")
+
+            if passed_tests == total_tests:
+                self._log("✅ All backend tests PASSED!")
+                return True
+            else:
+                self._log("❌ Some backend tests FAILED!")
+                return False
+        finally:
+            self._flush_log()
+
+    def get_summary(self) -> dict[str, dict[str, Any]]:
+        """Get test summary"""
+        # Timestamps are recorded as raw nanoseconds and only formatted here
+        return {
+            test_name: {
+                **result,
+                'timestamp': datetime.fromtimestamp(result['ts_ns'] / 1e9).isoformat()
+            }
+            for test_name, result in self.test_results.items()
+        }